@@ -0,0 +1,408 @@
+from Raster import Raster
+from RGB import RGB
+from array import array
+import struct
+import mmap
+import sys
+
+
+class Drawing:
+    """
+    The Drawing® Module.
+    Saves the primitives of an artwork (circles, paths and polygons) to replay them later.
+    The primitives are stored column by column, each column is one packed block in the file:
+    - sizes: float32 per primitive (radius, pensize or fill rule)
+    - offsets: uint32 per primitive + 1 (start of the points of each primitive)
+    - coords: float32 (x, y) per point
+    - ops: uint8 per primitive (op code)
+    - colors: uint8 (R, G, B) per primitive, from the RGB® color module
+    Loaded files are memory-mapped, the columns are used in place without parsing the records.
+
+    author: MKinG©™
+    """
+
+    # File format
+    MAGIC = b'MART'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHHIIII3sx')  # magic, version, reserved, width, height, primitives, points, bgcolor
+
+    # Op codes
+    CIRCLE = 1
+    PATH = 2
+    POLYGON = 3
+
+    # Fill rules of the polygons (stored as the size)
+    FILL_RULES = ('evenodd', 'nonzero')
+
+    def __init__(self, width=1280, height=720, bgcolor=None):
+        """
+        Initialize an empty Drawing® object.
+
+        :param width: Width of the drawing board in px.
+        :param height: Height of the drawing board in px.
+        :param bgcolor: Background color (RGB® object, '#hex' or (0-1, 0-1, 0-1)), random if None.
+        """
+
+        # Width, Height & Background of drawing board
+        self.width = width
+        self.height = height
+        self.bgcolor = Raster.to_bytes(RGB().hex if bgcolor is None else bgcolor)
+
+        # Columns
+        self.sizes = array('f')
+        self.offsets = array('I', [0])
+        self.coords = array('f')
+        self.ops = array('B')
+        self.colors = array('B')
+
+        # The memory-mapped file (read-only drawings)
+        self.buffer = None
+
+    def __repr__(self):
+        """Representation of Drawing® object."""
+        return f"Drawing® Object ⧉ v{self.VERSION} W:{self.width} × H:{self.height} | Primitives:{len(self)} | ID:{id(self)}"
+
+    def __len__(self):
+        """Number of the primitives."""
+        return len(self.ops)
+
+    def __enter__(self):
+        """Use the drawing in a 'with' block, the memory-mapped file is released at the end."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the memory-mapped file."""
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the memory-mapped file of a loaded drawing.
+        - the columns are emptied (the views can't outlive the file), drawings in memory are not changed
+        - raises 'BufferError' if views of the columns are still kept outside the drawing
+        """
+
+        if self.buffer is None:
+            return
+
+        # Release the views of the columns, then the file
+        for name in ('sizes', 'offsets', 'coords', 'ops', 'colors'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.format, [0] if name == 'offsets' else []))
+            column.release()
+        mapping = self.buffer.obj
+        self.buffer.release()
+        self.buffer = None
+        mapping.close()
+
+    def add(self, op, points, size, color) -> None:
+        """
+        Add a primitive to the columns.
+        - memory-mapped drawings are read-only, load them with 'mapped=False' to add more primitives
+        - each primitive needs at least one point
+
+        :param op: Op code of the primitive.
+        :param points: Sequence of (x, y) points.
+        :param size: Radius, pensize or fill rule.
+        :param color: Color (RGB® object, '#hex' or (0-1, 0-1, 0-1)), random if None.
+        """
+
+        if self.buffer is not None:
+            raise TypeError("Memory-mapped drawings are read-only")
+        points = list(points)
+        if not points:
+            raise ValueError("A primitive needs at least one point")
+
+        for x, y in points:
+            self.coords.append(x)
+            self.coords.append(y)
+        self.offsets.append(len(self.coords) // 2)
+        self.sizes.append(size)
+        self.ops.append(op)
+        self.colors.extend(Raster.to_bytes(color))
+
+    def add_circle(self, x, y, radius, color=None) -> None:
+        """
+        Add a filled circle.
+
+        :param x: x-coordinate of the center.
+        :param y: y-coordinate of the center.
+        :param radius: Radius of the circle.
+        :param color: Color of the circle, random if None.
+        """
+
+        self.add(self.CIRCLE, [(x, y)], radius, color)
+
+    def add_dot(self, x, y, size, color=None) -> None:
+        """
+        Add a dot like the turtle 'dot()' function.
+        - 'size' is the diameter of the dot, same as 'dot()'
+
+        :param x: x-coordinate of the dot.
+        :param y: y-coordinate of the dot.
+        :param size: Diameter of the dot.
+        :param color: Color of the dot, random if None.
+        """
+
+        self.add(self.CIRCLE, [(x, y)], size / 2, color)
+
+    def add_dots(self, points, size, colors=None) -> None:
+        """
+        Add many dots of the same size, like 'Raster.draw_dots()'.
+
+        :param points: Sequence of (x, y) points of the dots.
+        :param size: Diameter of the dots.
+        :param colors: A color or a sequence of colors (one per dot), random if None.
+        """
+
+        points = list(points)
+        colors = [colors] * len(points) if Raster.is_color(colors) else colors
+        for (x, y), color in zip(points, colors):
+            self.add_dot(x, y, size, color)
+
+    def add_path(self, points, pensize=1, color=None) -> None:
+        """
+        Add a path of lines.
+
+        :param points: Sequence of (x, y) points of the path.
+        :param pensize: Size of the pen.
+        :param color: Color of the pen, random if None.
+        """
+
+        self.add(self.PATH, points, pensize, color)
+
+    def add_line(self, start, end, pensize=1, color=None) -> None:
+        """
+        Add a line, like a move of the turtle with the pen down.
+        - the line continues the last path if it starts at its end with the same pen
+
+        :param start: The (x, y) start point.
+        :param end: The (x, y) end point.
+        :param pensize: Size of the pen.
+        :param color: Color of the pen, random if None.
+        """
+
+        # Same precision as the columns
+        color = Raster.to_bytes(color)
+        last = array('f', [*start, pensize])
+
+        # Continue the last path
+        if (len(self) and self.buffer is None and self.ops[-1] == self.PATH and self.sizes[-1] == last[2]
+                and bytes(self.colors[-3:]) == color and self.coords[-2:] == last[:2]):
+            self.coords.extend(end)
+            self.offsets[-1] = len(self.coords) // 2
+            return
+
+        self.add(self.PATH, [start, end], pensize, color)
+
+    def add_polygon(self, points, color=None, rule='evenodd') -> None:
+        """
+        Add a filled polygon (closed path).
+
+        :param points: Sequence of (x, y) points of the polygon.
+        :param color: Color of the fill, random if None.
+        :param rule: Fill rule, 'evenodd' or 'nonzero'.
+        """
+
+        if rule not in self.FILL_RULES:
+            raise ValueError(f"Unknown fill rule: {rule}")
+        self.add(self.POLYGON, points, self.FILL_RULES.index(rule), color)
+
+    def add_shape(self, paths, color=None, rule='evenodd') -> None:
+        """
+        Add a filled shape made of closed paths, like 'Raster.fill_paths()'.
+        - the paths are joined into one polygon, the joins go back and forth so they are never filled
+
+        :param paths: Sequence of paths, each one a sequence of (x, y) points.
+        :param color: Color of the fill, random if None.
+        :param rule: Fill rule, 'evenodd' or 'nonzero'.
+        """
+
+        paths = [list(path) for path in paths if path]
+        if not paths:
+            return
+
+        # Each path starts and ends at the first point of the shape
+        anchor = paths[0][0]
+        points = []
+        for path in paths:
+            points += [anchor, *path, path[0]]
+        self.add_polygon(points, color, rule)
+
+    def extend(self, drawing) -> None:
+        """
+        Add all the primitives of another drawing, in order.
+
+        :param drawing: The other Drawing® object.
+        """
+
+        if self.buffer is not None:
+            raise TypeError("Memory-mapped drawings are read-only")
+
+        start = self.offsets[-1]
+        self.sizes.extend(drawing.sizes)
+        self.offsets.extend(start + offset for offset in drawing.offsets[1:])
+        self.coords.extend(drawing.coords)
+        self.ops.extend(drawing.ops)
+        self.colors.extend(drawing.colors)
+
+    def points(self, index) -> list:
+        """
+        Get the points of a primitive.
+
+        :param index: Index of the primitive.
+        :return: List of (x, y) points.
+        """
+
+        coords = self.coords[self.offsets[index] * 2:self.offsets[index + 1] * 2]
+        return list(zip(coords[::2], coords[1::2]))
+
+    def save(self, path) -> str:
+        """
+        Save the drawing as a binary file.
+        - little-endian, the columns are stored after the header in order
+
+        :param path: Path of the output file.
+        :return: The path of the output file.
+        """
+
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, 0, self.width, self.height,
+                                  len(self), len(self.coords) // 2, bytes(self.bgcolor))
+
+        with open(path, 'wb') as file:
+            file.write(header)
+            for column in (self.sizes, self.offsets, self.coords):
+                column = array(column.typecode, column)
+                column.byteswap() if sys.byteorder == 'big' else None
+                file.write(column)
+            file.write(self.ops)
+            file.write(self.colors)
+        return path
+
+    @classmethod
+    def load(cls, path, mapped=True):
+        """
+        Load a drawing from a binary file.
+        - 'mapped=True': the columns are views of the memory-mapped file (read-only, nothing is copied)
+        - 'mapped=False': the columns are read into arrays (more primitives can be added)
+
+        :param path: Path of the file.
+        :param mapped: Memory-map the file or not.
+        :return: The Drawing® object.
+        """
+
+        with open(path, 'rb') as file:
+            # Big-endian machines can't use the little-endian file in place
+            mapped = mapped and sys.byteorder == 'little'
+            data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if mapped else file.read())
+
+        # Header
+        if len(data) < cls.HEADER.size:
+            raise ValueError(f"Truncated Drawing® file: {path}")
+        magic, version, _, width, height, count, points, bgcolor = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError(f"Not a Drawing® file: {path}")
+        if version > cls.VERSION:
+            raise ValueError(f"Unsupported Drawing® version: {version}")
+
+        drawing = cls(width, height, bgcolor)
+
+        # Columns: (name, typecode, length)
+        position = cls.HEADER.size
+        for name, typecode, length in (('sizes', 'f', count), ('offsets', 'I', count + 1), ('coords', 'f', points * 2),
+                                       ('ops', 'B', count), ('colors', 'B', count * 3)):
+            size = length * array(typecode).itemsize
+            if position + size > len(data):
+                raise ValueError(f"Truncated Drawing® file: {path}")
+            block = data[position:position + size]
+            position += size
+
+            if mapped:
+                column = block.cast(typecode)
+            else:
+                column = array(typecode, bytes(block))
+                column.byteswap() if sys.byteorder == 'big' and column.itemsize > 1 else None
+            setattr(drawing, name, column)
+
+        drawing.buffer = data if mapped else None
+        return drawing
+
+    def runs(self):
+        """
+        Split the primitives into runs of the same op code.
+
+        :return: Generator of (op, start, stop) runs.
+        """
+
+        ops = self.ops
+        start = 0
+        for index in range(1, len(ops) + 1):
+            if index == len(ops) or ops[index] != ops[start]:
+                yield ops[start], start, index
+                start = index
+
+    def replay(self, raster=None) -> Raster:
+        """
+        Replay the drawing on a Raster® object (headless).
+        - the circles of each run are drawn at once with 'draw_circles()'
+
+        :param raster: The Raster® object, a new one with the size and background of the drawing if None.
+        :return: The Raster® object.
+        """
+
+        raster = Raster(self.width, self.height, self.bgcolor) if raster is None else raster
+        colors = bytes(self.colors)
+
+        for op, start, stop in self.runs():
+            # Circles: one point for each circle
+            if op == self.CIRCLE:
+                coords = self.coords[self.offsets[start] * 2:self.offsets[stop] * 2]
+                raster.draw_circles(zip(coords[::2], coords[1::2]), self.sizes[start:stop],
+                                    [colors[i * 3:i * 3 + 3] for i in range(start, stop)])
+                continue
+
+            for index in range(start, stop):
+                color = colors[index * 3:index * 3 + 3]
+                if op == self.PATH:
+                    raster.draw_path(self.points(index), self.sizes[index], color)
+                elif op == self.POLYGON:
+                    raster.fill_polygon(self.points(index), color, self.FILL_RULES[int(self.sizes[index])])
+
+        return raster
+
+    def replay_turtle(self, art) -> None:
+        """
+        Replay the drawing on the screen with a ModernArt® object.
+        - the turtle will be back in the start position
+        - the polygons are filled with the fill rule of the screen, empty primitives are skipped
+
+        :param art: The ModernArt® object.
+        """
+
+        start_x, start_y = art.pos()
+        art.getscreen().bgcolor(f"#{bytes(self.bgcolor).hex()}")
+        art.penup()
+
+        for index in range(len(self)):
+            op = self.ops[index]
+            color = f"#{bytes(self.colors[index * 3:index * 3 + 3]).hex()}"
+            points = self.points(index)
+            if not points:
+                continue
+            art.teleport(*points[0])
+
+            if op == self.CIRCLE:
+                art.dot(self.sizes[index] * 2, color)
+            elif op == self.PATH:
+                art.pensize(self.sizes[index])
+                art.pencolor(color)
+                art.pendown()
+                art.draw_path(points)
+                art.penup()
+            elif op == self.POLYGON:
+                art.fillcolor(color)
+                art.begin_fill()
+                art.draw_path(points + points[:1])
+                art.end_fill()
+
+        # Move the turtle back to the start position
+        art.teleport(start_x, start_y)
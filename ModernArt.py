@@ -1,5 +1,9 @@
-from turtle import Turtle
+from turtle import Turtle, TNavigator, TPen, Vec2D
 from RGB import RGB
+from Raster import Raster
+from Drawing import Drawing
+import contextlib
+import functools
 import random
 import math
 
@@ -14,17 +18,45 @@ class ModernArt(Turtle):
     time: 1715070582.8347054"
     """
 
-    def __init__(self, width=1280, height=720):
+    # Line styles: dash patterns as (dash, space, ...) in units of the 'pensize'
+    LINE_STYLES = {
+        'solid': None,
+        'dashed': (5, 3),
+        'dotted': (1, 2),
+        'dash_dot': (5, 2, 1, 2),
+    }
+
+    # Maximum number of the cached polygon templates
+    POLYGON_CACHE_SIZE = 64
+
+    def __init__(self, width=1280, height=720, headless=False, drawing=None):
         """
         Initialize ModernArt® object.
-        # Feature: add line style like: dotted, dashed,...
+        - headless objects have no screen, only the position, heading and attributes of the turtle
+        - headless objects can only draw on a Raster® (the methods with a 'raster' parameter), the turtle can't move
+        - the lines, dots and fills (on the screen or a Raster®) are recorded to the 'drawing' if it's given
 
         :param width: Width of drawing board in px.
         :param height: Height of drawing board in px.
+        :param headless: Create the object without a screen (no Tk is required).
+        :param drawing: A Drawing® object to record the primitives (optional).
         """
 
+        # State cache: the attributes already applied to the turtle (before 'super()', the turtle may use it)
+        self.state = {}
+        self.sync = True  # Sync the ad-hoc changes to the attributes
+
+        # Recording: the Drawing® object, and the primitives drawn inside a fill (recorded after the fill)
+        self.drawing = drawing
+        self.fill_drawing = None
+
         # initialize and create a turtle.Turtle() object
-        super().__init__()
+        self.headless = headless
+        if headless:
+            TNavigator.__init__(self)
+            TPen.__init__(self)
+        else:
+            super().__init__()
 
         # Width & Height of drawing board
         self.width = width
@@ -43,7 +75,9 @@ class ModernArt(Turtle):
         self.pen_attr = {
             'pensize': 2,
             'pencolor': RGB().hex,
-            'visible': True
+            'visible': True,
+            'line_style': 'solid',
+            'dash_phase': 0
         }
 
         # Fill attributes
@@ -105,23 +139,35 @@ class ModernArt(Turtle):
         if visible is not None:
             attributes['visible'] = visible
 
-        # Set up the turtle with updated attributes
-        self.speed(attributes['speed'])
-        self.color(attributes['color'])
-        self.shape(attributes['shape'])
-        self.shapesize(attributes['shapesize'])
-        self.hideturtle() if not attributes['visible'] else self.showturtle()
+        # Set up the turtle with updated attributes (the no-op updates are skipped)
+        with self.unsynced():
+            self.speed(attributes['speed'])
+            self.color(attributes['color'])
+            self.shape(attributes['shape'])
+            self.shapesize(attributes['shapesize'])
+            self.hideturtle() if not attributes['visible'] else self.showturtle()
 
     # Pen Setup
-    def setup_pen(self, pensize=None, pencolor=None, visible=None) -> None:
+    def setup_pen(self, pensize=None, pencolor=None, visible=None, line_style=None, dash_phase=None) -> None:
         """
         Set up the pen with specified attributes.
+        - 'line_style' is a name of 'LINE_STYLES' or a dash pattern in px like: (dash, space, ...)
 
         :param pensize: Size of the pen.
         :param pencolor: Color of the pen.
         :param visible: Visibility of the pen.
+        :param line_style: Style of the lines ('solid', 'dashed', 'dotted', 'dash_dot' or a dash pattern).
+        :param dash_phase: Offset of the dash pattern at the start of each path in px.
         """
 
+        # Check the line style before it's used by the drawings
+        if isinstance(line_style, str) and line_style not in self.LINE_STYLES:
+            raise ValueError(f"Unknown line style: {line_style}")
+        if line_style is not None and not isinstance(line_style, str):
+            self.check_dashes(line_style)
+        if dash_phase is not None and not isinstance(dash_phase, (int, float)):
+            raise ValueError(f"Invalid dash phase: {dash_phase}")
+
         # Shortcut
         attributes = self.pen_attr
 
@@ -132,11 +178,16 @@ class ModernArt(Turtle):
             attributes['pencolor'] = pencolor
         if visible is not None:
             attributes['visible'] = visible
+        if line_style is not None:
+            attributes['line_style'] = line_style
+        if dash_phase is not None:
+            attributes['dash_phase'] = dash_phase
 
-        # Set up the pen with updated attributes
-        self.pensize(attributes['pensize'])
-        self.pencolor(attributes['pencolor'])
-        self.penup() if not attributes['visible'] else self.pendown()
+        # Set up the pen with updated attributes (the no-op updates are skipped)
+        with self.unsynced():
+            self.pensize(attributes['pensize'])
+            self.pencolor(attributes['pencolor'])
+            self.penup() if not attributes['visible'] else self.pendown()
 
     # Fill Setup
     def setup_fill(self, fillcolor=None) -> None:
@@ -153,8 +204,365 @@ class ModernArt(Turtle):
         if fillcolor is not None:
             attributes['fillcolor'] = fillcolor
 
-        # Set up the fill with updated attributes
-        self.fillcolor(attributes['fillcolor'])
+        # Set up the fill with updated attributes (the no-op updates are skipped)
+        with self.unsynced():
+            self.fillcolor(attributes['fillcolor'])
+
+    # State cache key of a value
+    @staticmethod
+    def state_key(value):
+        """
+        Get the key of a value for the state cache.
+        - RGB® objects are compared by their values, lists as tuples
+
+        :param value: The value of an attribute.
+        :return: A hashable and comparable key.
+        """
+
+        if isinstance(value, RGB):
+            return 'RGB', value.r, value.g, value.b
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    # State cache key of a color
+    def color_key(self, color):
+        """
+        Get the key of a color for the state cache.
+        - numeric colors are keyed by their Tk color string, so the key follows the 'colormode()' of the screen
+        - color strings are keyed as they are (no Tk round trip)
+
+        :param color: The color, same as 'Turtle.pencolor()'.
+        :return: A hashable and comparable key.
+        """
+
+        if self.headless or isinstance(color, str):
+            return self.state_key(color)
+        return 'Tk', self._colorstr((color,))
+
+    # Check the state cache
+    def applied(self, name, value) -> bool:
+        """
+        Check if the value of the attribute is already applied to the turtle.
+
+        :param name: Name of the attribute.
+        :param value: The value of the attribute.
+        :return: True if the update is a no-op.
+        """
+
+        key = self.color_key(value) if name in ('pencolor', 'fillcolor') else self.state_key(value)
+        return name in self.state and self.state[name] == key
+
+    # Apply attributes without syncing
+    @contextlib.contextmanager
+    def unsynced(self):
+        """
+        Apply attributes without syncing them back to 'turtle_attr', 'pen_attr' and 'fill_attr'.
+        - for the setup methods, the attributes are the source of the changes
+        """
+
+        sync = self.sync
+        self.sync = False
+        try:
+            yield
+        finally:
+            self.sync = sync
+
+    # All pen and turtle changes of 'Turtle' pass through 'pen()'
+    def pen(self, pen=None, **pendict):
+        """
+        Return or set the pen's attributes, same as 'Turtle.pen()'.
+        - the changed attributes are removed from the state cache (they may come from outside the cache)
+        - the ad-hoc changes are synced to 'turtle_attr', 'pen_attr' and 'fill_attr'
+
+        :param pen: A dictionary of the pen's attributes.
+        :param pendict: The pen's attributes as keyword arguments.
+        :return: The dictionary of the pen's attributes if no argument is given.
+        """
+
+        changes = dict(pen) if isinstance(pen, dict) else {}
+        changes.update(pendict)
+
+        # Forget the changed attributes
+        for name in changes:
+            self.state.pop(name, None)
+        if changes.keys() & {'resizemode', 'stretchfactor', 'outline'}:
+            self.state.pop('shapesize', None)
+
+        result = super().pen(pen, **pendict)
+
+        # Sync the attributes: (name of the change, attributes, name of the attribute)
+        if self.sync and changes:
+            for name, attributes, key in (('pencolor', self.pen_attr, 'pencolor'),
+                                          ('pensize', self.pen_attr, 'pensize'),
+                                          ('pendown', self.pen_attr, 'visible'),
+                                          ('fillcolor', self.fill_attr, 'fillcolor'),
+                                          ('speed', self.turtle_attr, 'speed'),
+                                          ('shown', self.turtle_attr, 'visible')):
+                if name in changes:
+                    attributes[key] = changes[name]
+
+        return result
+
+    def reset(self) -> None:
+        """
+        Delete the turtle's drawings and restore its default values, same as 'Turtle.reset()'.
+        - the state cache is cleared, the defaults are set without 'pen()'
+        - headless objects only restore the position, heading and pen state
+        """
+
+        if self.headless:
+            TNavigator.reset(self)
+            TPen._reset(self)
+        else:
+            super().reset()
+        self.state.clear()
+
+    def _update(self) -> None:
+        """Update the screen, same as 'Turtle._update()'. Headless objects have no screen."""
+        None if self.headless else super()._update()
+
+    def _newLine(self, usePos=True) -> None:
+        """Start a new line on the screen, same as 'Turtle._newLine()'. Headless objects have no screen."""
+        None if self.headless else super()._newLine(usePos)
+
+    def _colorstr(self, args):
+        """Convert a color to a Tk color string, same as 'Turtle._colorstr()'. Headless objects keep the color."""
+        if self.headless:
+            return args[0] if len(args) == 1 else args
+        return super()._colorstr(args)
+
+    def _color(self, cstr):
+        """Convert a Tk color string to a color, same as 'Turtle._color()'. Headless objects keep the color."""
+        return cstr if self.headless else super()._color(cstr)
+
+    # Recording of the screen drawings
+    def record_color(self, cstr) -> bytes:
+        """
+        Convert a Tk color string of the turtle to bytes for the Drawing®.
+
+        :param cstr: The Tk color string, like: '#ffffff' or 'red'.
+        :return: Bytes of the color (0-255, 0-255, 0-255).
+        """
+
+        if cstr.startswith('#') and len(cstr) == 7:
+            return bytes.fromhex(cstr[1:])
+        return bytes(value // 257 for value in self.getscreen().getcanvas().winfo_rgb(cstr))
+
+    def _goto(self, end) -> None:
+        """Move the turtle, same as 'Turtle._goto()'. The lines are recorded to the Drawing®."""
+        if self.drawing is not None and self._drawing:
+            self.drawing.add_line(tuple(self._position), tuple(end), self._pensize, self.record_color(self._pencolor))
+        super()._goto(end)
+
+    def dot(self, size=None, *color) -> None:
+        """
+        Draw a circular dot, same as 'Turtle.dot()'.
+        - the dot is recorded to the Drawing®
+
+        :param size: Diameter of the dot.
+        :param color: Color of the dot.
+        """
+
+        if self.drawing is not None:
+            # Same defaults as 'Turtle.dot()'
+            if not color and isinstance(size, (str, tuple)):
+                size, color = None, (size,)
+            cstr = self._colorstr(color) if color else self._pencolor
+            diameter = size if size else self._pensize + max(self._pensize, 4)
+            self.drawing.add_dot(*self.pos(), diameter, self.record_color(cstr))
+        super().dot(size, *color)
+
+    def begin_fill(self) -> None:
+        """
+        Start a fill, same as 'Turtle.begin_fill()'.
+        - the primitives drawn inside the fill are recorded after it, so the fill stays below them
+        """
+
+        if self.drawing is not None and self.fill_drawing is None:
+            self.fill_drawing, self.drawing = self.drawing, Drawing(self.width, self.height)
+        super().begin_fill()
+
+    def end_fill(self) -> None:
+        """
+        Fill the shape drawn after 'begin_fill()', same as 'Turtle.end_fill()'.
+        - the fill is recorded to the Drawing® as a polygon
+        """
+
+        if self.fill_drawing is None:
+            super().end_fill()
+            return
+
+        path = [tuple(point) for point in self._fillpath] if self.filling() else []
+        color = self.record_color(self._fillcolor)
+        super().end_fill()
+
+        # Record the fill, then the primitives inside it
+        self.drawing, inside = self.fill_drawing, self.drawing
+        self.fill_drawing = None
+        self.drawing.add_polygon(path, color) if len(path) > 2 else None
+        self.drawing.extend(inside)
+
+    def undo(self) -> None:
+        """
+        Undo the last turtle action, same as 'Turtle.undo()'.
+        - the state cache is cleared, the pen changes are undone without 'pen()'
+        """
+
+        super().undo()
+        self.state.clear()
+
+    def pencolor(self, *args):
+        """
+        Set or return the pen color, same as 'Turtle.pencolor()'.
+        - the no-op updates are skipped
+
+        :param args: The color, same as 'Turtle.pencolor()'.
+        :return: The pen color if no argument is given.
+        """
+
+        if not args:
+            return super().pencolor()
+
+        color = args[0] if len(args) == 1 else args
+        if self.applied('pencolor', color):
+            return
+        super().pencolor(*args)
+        self.state['pencolor'] = self.color_key(color)
+
+    def fillcolor(self, *args):
+        """
+        Set or return the fill color, same as 'Turtle.fillcolor()'.
+        - the no-op updates are skipped
+
+        :param args: The color, same as 'Turtle.fillcolor()'.
+        :return: The fill color if no argument is given.
+        """
+
+        if not args:
+            return super().fillcolor()
+
+        color = args[0] if len(args) == 1 else args
+        if self.applied('fillcolor', color):
+            return
+        super().fillcolor(*args)
+        self.state['fillcolor'] = self.color_key(color)
+
+    def color(self, *args):
+        """
+        Set or return the pen color and the fill color, same as 'Turtle.color()'.
+        - the no-op updates are skipped
+
+        :param args: The color(s), same as 'Turtle.color()'.
+        :return: The pen color and the fill color if no argument is given.
+        """
+
+        if not args:
+            return super().color()
+
+        # Pen color and fill color
+        if len(args) == 2:
+            pencolor, fillcolor = args
+        else:
+            pencolor = fillcolor = args[0] if len(args) == 1 else args
+        if self.applied('pencolor', pencolor) and self.applied('fillcolor', fillcolor):
+            return
+
+        super().color(*args)
+        self.state['pencolor'] = self.color_key(pencolor)
+        self.state['fillcolor'] = self.color_key(fillcolor)
+        if self.sync and len(args) != 2:
+            self.turtle_attr['color'] = pencolor
+
+    def pensize(self, width=None):
+        """
+        Set or return the line thickness, same as 'Turtle.pensize()'.
+        - the no-op updates are skipped
+
+        :param width: The line thickness.
+        :return: The line thickness if no argument is given.
+        """
+
+        if width is None:
+            return super().pensize()
+        if self.applied('pensize', width):
+            return
+        super().pensize(width)
+        self.state['pensize'] = self.state_key(width)
+
+    def speed(self, speed=None):
+        """
+        Set or return the turtle's speed, same as 'Turtle.speed()'.
+        - the no-op updates are skipped
+
+        :param speed: The speed (0 to 10) or a speed string.
+        :return: The speed if no argument is given.
+        """
+
+        if speed is None:
+            return super().speed()
+        if self.applied('speed', speed):
+            return
+        super().speed(speed)
+        self.state['speed'] = self.state_key(speed)
+
+    def shape(self, name=None):
+        """
+        Set or return the turtle's shape, same as 'Turtle.shape()'.
+        - the no-op updates are skipped
+
+        :param name: Name of the shape.
+        :return: Name of the shape if no argument is given.
+        """
+
+        if name is None:
+            return self.turtle_attr['shape'] if self.headless else super().shape()
+        if self.applied('shape', name):
+            return
+        super().shape(name) if not self.headless else None
+        self.state['shape'] = name
+        if self.sync:
+            self.turtle_attr['shape'] = name
+
+    def shapesize(self, stretch_wid=None, stretch_len=None, outline=None):
+        """
+        Set or return the turtle's shape size, same as 'Turtle.shapesize()'.
+        - the no-op updates are skipped
+
+        :param stretch_wid: Stretch factor perpendicular to the orientation.
+        :param stretch_len: Stretch factor in the direction of the orientation.
+        :param outline: Width of the shape's outline.
+        :return: The shape size if no argument is given.
+        """
+
+        if stretch_wid is stretch_len is outline is None:
+            return super().shapesize()
+
+        size = (stretch_wid, stretch_len, outline)
+        if self.applied('shapesize', size):
+            return
+        super().shapesize(stretch_wid, stretch_len, outline)
+        self.state['shapesize'] = size
+        if self.sync and stretch_len is outline is None:
+            self.turtle_attr['shapesize'] = stretch_wid
+
+    def showturtle(self) -> None:
+        """
+        Make the turtle visible, same as 'Turtle.showturtle()'.
+        - skipped if the turtle is visible
+        """
+
+        if not self.isvisible():
+            super().showturtle()
+
+    def hideturtle(self) -> None:
+        """
+        Make the turtle invisible, same as 'Turtle.hideturtle()'.
+        - skipped if the turtle is invisible
+        """
+
+        if self.isvisible():
+            super().hideturtle()
 
     # Full Setup Wizard
     def setup_wizard(self) -> None:
@@ -174,13 +582,290 @@ class ModernArt(Turtle):
         """
         Set the turtle color to a random color.
         This will change the 'pencolor()' and 'fillcolor()'.
-        - the change won't save as 'turtle.attr'
+        - the change will be synced to 'turtle_attr', 'pen_attr' and 'fill_attr'
         # Feature: Change color optional or random
         """
 
         # Turtle().turtle.color()
         self.color(RGB().hex)
 
+    # The dash pattern of the pen
+    def dash_pattern(self):
+        """
+        Get the dash pattern of the current line style in px.
+        - named styles are scaled by the 'pensize'
+
+        :return: Tuple of (dash, space, ...) lengths, or None for solid lines.
+        """
+
+        style = self.pen_attr['line_style']
+
+        # Named style
+        if isinstance(style, str):
+            pattern = self.LINE_STYLES[style]
+            return None if pattern is None else tuple(length * self.pen_attr['pensize'] for length in pattern)
+        # Dash pattern
+        return None if style is None else tuple(style)
+
+    # Check a dash pattern
+    @staticmethod
+    def check_dashes(dashes) -> list:
+        """
+        Check a dash pattern: non-negative lengths, at least one of them positive.
+
+        :param dashes: Dash pattern as (dash, space, ...) lengths.
+        :return: List of the lengths.
+        """
+
+        try:
+            pattern = [float(length) for length in dashes]
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid dash pattern: {dashes}") from None
+        if not pattern or sum(pattern) <= 0 or min(pattern) < 0:
+            raise ValueError(f"Invalid dash pattern: {dashes}")
+        return pattern
+
+    # Split a path into dashes
+    @staticmethod
+    def dash_segments(points, dashes, phase=0) -> list:
+        """
+        Split a path into dashes, based on the dash pattern.
+        - the dashes are calculated along the whole path, a dash may continue through the corners
+        - an odd pattern is repeated twice, like: (5,) -> (5, 5)
+        - each dash is '(edge, points)', the segment between 'points[k]' and 'points[k + 1]' is on the path edge 'edge + k'
+
+        :param points: Sequence of (x, y) points of the path.
+        :param dashes: Dash pattern as (dash, space, ...) lengths.
+        :param phase: Offset of the dash pattern at the start of the path.
+        :return: List of dashes.
+        """
+
+        # Check the dash pattern
+        pattern = ModernArt.check_dashes(dashes)
+        pattern = pattern * (2 if len(pattern) % 2 else 1)
+        total = sum(pattern)
+
+        # Find the start of the pattern
+        index = 0
+        remaining = pattern[0]
+        phase = phase % total
+        while phase >= remaining:
+            phase -= remaining
+            index = (index + 1) % len(pattern)
+            remaining = pattern[index]
+        remaining -= phase
+
+        # Walk on the path
+        points = [tuple(point) for point in points]
+        dash = (0, [points[0]]) if index % 2 == 0 else None
+        result = []
+        for edge in range(len(points) - 1):
+            (x0, y0), (x1, y1) = points[edge], points[edge + 1]
+            length = math.hypot(x1 - x0, y1 - y0)
+            position = 0
+
+            # The pattern changes on this edge
+            while length - position > remaining:
+                position += remaining
+                point = (x0 + (x1 - x0) * position / length, y0 + (y1 - y0) * position / length)
+                if dash is not None:
+                    dash[1].append(point)
+                    result.append(dash)
+                    dash = None
+                else:
+                    dash = (edge, [point])
+                index = (index + 1) % len(pattern)
+                remaining = pattern[index]
+
+            # The rest of the edge
+            remaining -= length - position
+            if dash is not None:
+                dash[1].append(points[edge + 1])
+
+        # The last dash
+        if dash is not None and len(dash[1]) > 1:
+            result.append(dash)
+        return result
+
+    # Points of a circle like 'circle()'
+    def circle_path(self, radius, extent=360, steps=None, x=None, y=None, heading=None) -> list:
+        """
+        Get the points of a circle, same as the path of the 'circle()' function.
+        - the center is 'radius' units left of the turtle, negative radius goes clockwise
+        - the turtle won't move, the start point and heading can be given instead of the turtle's
+
+        :param radius: Radius of the circle.
+        :param extent: The part of the circle to draw in degrees.
+        :param steps: Number of the line segments (default is same as 'circle()').
+        :param x: x-coordinate of the start point (default is the turtle's).
+        :param y: y-coordinate of the start point (default is the turtle's).
+        :param heading: Heading at the start point (default is the turtle's).
+        :return: List of (x, y) points.
+        """
+
+        # Number of the line segments
+        if steps is None:
+            frac = abs(extent) / 360
+            steps = 1 + int(min(11 + abs(radius) / 6.0, 59.0) * frac)
+
+        # Position, heading and center
+        x, y = self.pos() if x is None or y is None else (x, y)
+        normal = math.radians((self.heading() if heading is None else heading) + 90)
+        center_x = x + radius * math.cos(normal)
+        center_y = y + radius * math.sin(normal)
+        turn = math.radians(extent) * (1 if radius >= 0 else -1)
+
+        return [(center_x - radius * math.cos(normal + turn * i / steps),
+                 center_y - radius * math.sin(normal + turn * i / steps)) for i in range(steps + 1)]
+
+    # Move without a line
+    def jump(self, x, y, through=()) -> None:
+        """
+        Move the turtle to a point without drawing a line, like 'teleport()'.
+        - the pen state is not changed, only the current line ends ('teleport()' calls 'pen()' twice)
+        - inside a fill, the points of 'through' and the end point are added to the fill, same as pen-up moves
+        - the screen is not updated, the next move will update it
+
+        :param x: x-coordinate of the point.
+        :param y: y-coordinate of the point.
+        :param through: Sequence of (x, y) points passed on the way (optional).
+        """
+
+        if isinstance(getattr(self, '_fillpath', None), list):
+            self._fillpath.extend(Vec2D(*point) for point in through)
+            self._fillpath.append(Vec2D(x, y))
+        self._position = Vec2D(x, y)
+        self._newLine()
+
+    # Draw a path with the line style
+    def draw_path(self, points, colors=None, dashes=None, phase=None) -> None:
+        """
+        Draw a path with the line style of the pen.
+        Powered by 'dash_segments()'.
+        - the turtle ends at the last point of the path
+        - the gaps are crossed with 'jump()', inside a fill through the path points, so the whole path is filled
+        - nothing will be drawn if the pen is up, the turtle only walks on the path
+
+        :param points: Sequence of (x, y) points of the path.
+        :param colors: Pen color of each edge of the path (optional).
+        :param dashes: Dash pattern (default is the line style of the pen).
+        :param phase: Offset of the dash pattern (default is the 'dash_phase' of the pen).
+        """
+
+        points = [tuple(point) for point in points]
+
+        # Pen is up: only walk
+        if not self.isdown():
+            for point in points[1:]:
+                self.goto(point)
+            return
+
+        dashes = self.dash_pattern() if dashes is None else dashes
+        phase = self.pen_attr['dash_phase'] if phase is None else phase
+
+        # Solid line: one dash for the whole path
+        dashes = [(0, points)] if dashes is None else self.dash_segments(points, dashes, phase)
+
+        passed = -1  # The last edge of the path that is passed
+        for edge, dash in dashes:
+            # The gap: the passed path points are added to the fill
+            self.jump(*dash[0], through=points[passed + 1:edge + 1])
+
+            for k, point in enumerate(dash[1:]):
+                self.pencolor(colors[edge + k]) if colors is not None else None
+                self.goto(point)
+            passed = edge + len(dash) - 2
+
+        # Move to the end of the path
+        self.jump(*points[-1], through=points[passed + 1:-1])
+        self._update()
+
+    # Draw a circle with the line style
+    def draw_arc(self, radius, extent=360, steps=None) -> None:
+        """
+        Draw a circle like 'circle()' with the line style of the pen.
+        Powered by 'circle_path()' and 'draw_path()'.
+
+        :param radius: Radius of the circle.
+        :param extent: The part of the circle to draw in degrees.
+        :param steps: Number of the line segments (optional).
+        """
+
+        # Solid line
+        if self.dash_pattern() is None:
+            self.circle(radius, extent, steps)
+            return
+
+        heading = self.heading()
+        self.draw_path(self.circle_path(radius, extent, steps))
+        self.setheading(heading + extent if radius >= 0 else heading - extent)
+
+    # Draw a shape on a Raster®
+    def raster_shape(self, raster, paths, fill=False, rule='evenodd', color=None, stroke=True) -> None:
+        """
+        Draw a shape made of closed paths on a Raster® object (headless), like 'begin_fill()' and the pen.
+        Powered by 'Raster.fill_paths()' and 'dash_segments()'.
+        - the fill uses the 'fillcolor' attribute, the outlines use the 'pencolor', 'pensize' and line style
+        - no outline is drawn if the pen is up
+
+        :param raster: The Raster® object.
+        :param paths: Sequence of paths, each one a sequence of (x, y) points.
+        :param fill: Fill the shape or not.
+        :param rule: Fill rule, 'evenodd' or 'nonzero'.
+        :param color: Color of the fill and the outlines (default is the attributes).
+        :param stroke: Draw the outlines or not.
+        """
+
+        paths = [list(path) for path in paths]
+
+        # Fill: all paths as one shape
+        if fill:
+            raster.fill_paths(paths, self.fill_attr['fillcolor'] if color is None else color, rule)
+            self.drawing.add_shape(paths, self.fill_attr['fillcolor'] if color is None else color,
+                                   rule) if self.drawing is not None else None
+
+        # Outlines
+        if stroke and self.isdown():
+            dashes = self.dash_pattern()
+            for path in paths:
+                strokes = [path] if dashes is None else [dash for _, dash in
+                                                         self.dash_segments(path, dashes, self.pen_attr['dash_phase'])]
+                for stroke in strokes:
+                    raster.draw_path(stroke, self.pen_attr['pensize'],
+                                     self.pen_attr['pencolor'] if color is None else color)
+                    self.drawing.add_path(stroke, self.pen_attr['pensize'], self.pen_attr['pencolor'] if color is None
+                                          else color) if self.drawing is not None else None
+
+    # Draw circles on a Raster®
+    def raster_circles(self, raster, centers, radius, fill=False, colors=None) -> None:
+        """
+        Draw circles on a Raster® object (headless), like 'draw_circle()' on the screen.
+        Powered by 'Raster.draw_circles()', all fills are drawn at once with anti-aliased edges.
+        - the fills use the 'fillcolor' attribute, the outlines use the pen (drawn over all fills)
+
+        :param raster: The Raster® object.
+        :param centers: Sequence of (x, y) centers.
+        :param radius: Radius of the circles.
+        :param fill: Fill the circles or not.
+        :param colors: A color or a sequence of colors (one per circle) for the fills and the outlines (optional).
+        """
+
+        centers = [tuple(center) for center in centers]
+        colors = [colors] * len(centers) if Raster.is_color(colors) else list(colors)
+
+        # Fills: one batch
+        if fill:
+            fill_colors = [self.fill_attr['fillcolor'] if color is None else color for color in colors]
+            raster.draw_circles(centers, abs(radius), fill_colors)
+            if self.drawing is not None:
+                for (x, y), color in zip(centers, fill_colors):
+                    self.drawing.add_circle(x, y, abs(radius), color)
+
+        # Outlines
+        if self.isdown():
+            for (x, y), color in zip(centers, colors):
+                self.raster_shape(raster, [self.circle_path(radius, x=x, y=y - radius, heading=0)], color=color)
+
     # Draw a circle mathematical calculation
     def draw_circle_math(self, radius, center_x=None, center_y=None) -> None:
         """
@@ -245,7 +930,7 @@ class ModernArt(Turtle):
         del y_sin
 
     # Draw a circle
-    def draw_circle(self, radius, center_x=None, center_y=None, fill=False, center_base=True) -> None:
+    def draw_circle(self, radius, center_x=None, center_y=None, fill=False, center_base=True, raster=None) -> None:
         """
         Draw a circle using built-in circle() function.
         - custom function to make drawings more easily
@@ -256,6 +941,7 @@ class ModernArt(Turtle):
         :param center_y: y-coordinate of the center (optional).
         :param fill: Fill the circle or not.
         :param center_base: If true, draw the circle with the current position as the center.
+        :param raster: Draw on a Raster® object (headless) instead of the screen.
         """
 
         # Store the current position of the turtle
@@ -267,6 +953,13 @@ class ModernArt(Turtle):
         else:
             start_x, start_y = (center_x, center_y)
 
+        # Headless: the center of the circle, same as 'circle()' from the start point, the turtle won't move
+        if raster is not None:
+            x, y = (start_x, start_y - radius) if center_base else (start_x, start_y)
+            normal = math.radians(self.heading() + 90)
+            self.raster_circles(raster, [(x + radius * math.cos(normal), y + radius * math.sin(normal))], radius, fill)
+            return
+
         # Move the turtle to the specified center position if center_base is False
         self.teleport(start_x, start_y - radius) if center_base else self.teleport(start_x, start_y)
 
@@ -275,7 +968,7 @@ class ModernArt(Turtle):
             self.begin_fill() if fill else None
 
         # Draw the circle with the specified radius
-        self.circle(radius)
+        self.draw_arc(radius)
 
         # End filling the shape if fill is True
         if fill:
@@ -294,29 +987,104 @@ class ModernArt(Turtle):
         :param repeat: Number of sides to draw.
         """
 
+        # Dashed line: draw the sides as one path
+        if self.dash_pattern() is not None:
+            points = [self.pos()]
+            heading = self.heading()
+            for _ in range(repeat):
+                x, y = points[-1]
+                points.append((x + length * math.cos(math.radians(heading)),
+                               y + length * math.sin(math.radians(heading))))
+                heading -= angle
+            self.draw_path(points)
+            self.setheading(heading)
+            return
+
         # Draw side(s)
         for _ in range(repeat):
             self.fd(length)  # Move forward
             self.right(angle)  # Turn right based on the angle
 
+    # Vertices of a unit polygon
+    @staticmethod
+    @functools.lru_cache(maxsize=POLYGON_CACHE_SIZE)
+    def polygon_template(sides) -> tuple:
+        """
+        Get the vertices of a regular polygon with radius 1 around (0, 0).
+        - cached by 'sides', the recently used templates are kept (LRU)
+        - counterclockwise, the first side is at the bottom and goes to the right (+x)
+
+        :param sides: Number of the polygon sides.
+        :return: Tuple of (x, y) vertices.
+        """
+
+        start = -math.pi / 2 - math.pi / sides  # The first side is horizontal
+        return tuple((math.cos(start + 2 * math.pi * k / sides),
+                      math.sin(start + 2 * math.pi * k / sides)) for k in range(sides))
+
+    # Scale, rotate and move points
+    @staticmethod
+    def transform_points(points, scale=1, rotation=0, x=0, y=0, mirror=False, origin=(0, 0)) -> list:
+        """
+        Transform points with one affine transform.
+        - the points are mirrored (optional), scaled and rotated around 'origin', then moved to (x, y)
+
+        :param points: Sequence of (x, y) points.
+        :param scale: Scale of the points.
+        :param rotation: Rotation in degrees (counterclockwise).
+        :param x: x-coordinate of the new place of 'origin'.
+        :param y: y-coordinate of the new place of 'origin'.
+        :param mirror: Mirror the points on the x-axis (counterclockwise to clockwise).
+        :param origin: The fixed point of the transform.
+        :return: List of (x, y) points.
+        """
+
+        # The transform matrix
+        cos = scale * math.cos(math.radians(rotation))
+        sin = scale * math.sin(math.radians(rotation))
+        sign = -1 if mirror else 1
+        ox, oy = origin
+
+        return [(x + cos * (px - ox) - sin * sign * (py - oy),
+                 y + sin * (px - ox) + cos * sign * (py - oy)) for px, py in points]
+
+    # Draw a regular polygon
+    def draw_polygon(self, sides, side_length, clockwise=True, rotation=0) -> None:
+        """
+        Draw a regular polygon from the current position and heading.
+        Powered by 'polygon_template()' and 'draw_path()'.
+        - same as walking the sides with 'fd()' and 'right()' (or 'left()' if not clockwise)
+
+        :param sides: Number of the polygon sides.
+        :param side_length: Length of each side.
+        :param clockwise: Turn right after each side, else turn left.
+        :param rotation: Rotation of the first side from the heading in degrees.
+        """
+
+        template = self.polygon_template(sides)
+        scale = side_length / (2 * math.sin(math.pi / sides))  # Side length to radius
+        x, y = self.pos()
+        heading = self.heading() + rotation * (-1 if clockwise else 1)
+        points = self.transform_points(template, scale, heading, x, y, mirror=clockwise, origin=template[0])
+        self.draw_path(points + points[:1])
+
     # Draw a polygon shapes
     def draw_side_shape(self, side_length, sides) -> None:
         """
         Draw a polygon shape.
-        Powered by 'draw_side()'.
+        Powered by 'draw_polygon()'.
 
         :param sides: Number of the polygon sides.
         :param side_length: Length of each side.
         """
 
-        ang = 360 / sides  # Calculate the 'angle' of each turn base on 'sides'
-        self.draw_side(side_length, ang, sides)  # Draw
+        self.draw_polygon(sides, side_length)  # Draw
 
     # Draw a triangle
     def draw_triangle(self, width, angle=120) -> None:
         """
         Draw a Triangle shape.
-        Powered by 'draw_side()'.
+        Powered by 'draw_polygon()' or 'draw_side()' if the angle is not regular.
         - use '-120 degrees' for angle to change the direction of  drawing the triangle.
 
         :param width: Width of the triangle.
@@ -324,13 +1092,16 @@ class ModernArt(Turtle):
         """
 
         # Draw a triangle
-        self.draw_side(width, angle, 3)
+        if abs(angle) == 120:
+            self.draw_polygon(3, width, clockwise=angle > 0)
+        else:
+            self.draw_side(width, angle, 3)
 
     # Draw a square
     def draw_square(self, width, angle=90) -> None:
         """
         Draw a Square shape.
-        Powered by 'draw_side()'.
+        Powered by 'draw_polygon()' or 'draw_side()' if the angle is not regular.
         - use '-90 degrees' for angle to change the direction of  drawing the triangle.
 
         :param width: Width of the square.
@@ -338,20 +1109,82 @@ class ModernArt(Turtle):
         """
 
         # Draw a square
-        self.draw_side(width, angle, 4)
+        if abs(angle) == 90:
+            self.draw_polygon(4, width, clockwise=angle > 0)
+        else:
+            self.draw_side(width, angle, 4)
 
     # Draw shapes base on radius with 'circle()'
     def draw_shape(self, radius, sides) -> None:
         """
-        Draw shapes with the 'circle()' that based on radius.
+        Draw shapes same as the 'circle()' that based on radius.
         A shadow of 'draw_side_shape()'.
+        Powered by 'draw_polygon()'.
 
         :param radius: The radius of the hypothetical circle.
         :param sides: The sides of the polygon shape.
         """
 
-        # feature: do the math to calculate width of each side
-        self.circle(radius, 360, sides)  # step as 'sides' to complete 360deg. | each turn angle: 'sides' / 360
+        # The side of 'circle(radius, 360, sides)' is rotated half a turn from the heading
+        side_length = 2 * abs(radius) * math.sin(math.pi / sides)
+        self.draw_polygon(sides, side_length, clockwise=radius < 0, rotation=180 / sides)
+
+    # Stamp many polygons
+    def stamp_polygons(self, centers, radius, sides, rotations=0, colors=None, fill=False, raster=None) -> None:
+        """
+        Draw many regular polygons at once.
+        Powered by 'polygon_template()', one template is transformed for all polygons.
+        - the turtle will be back in the start position
+
+        :param centers: Sequence of (x, y) centers.
+        :param radius: Radius of all polygons, or a sequence of radii (one per polygon).
+        :param sides: Number of the polygon sides.
+        :param rotations: Rotation of all polygons in degrees, or a sequence of rotations.
+        :param colors: A color or a sequence of colors (one per polygon), the current color if None.
+        :param fill: Fill the polygons or not.
+        :param raster: Draw on a Raster® object (headless) instead of the screen, the outlines are drawn over all fills.
+        """
+
+        # Materials
+        centers = list(centers)
+        count = len(centers)
+        template = self.polygon_template(sides)
+        radii = [radius] * count if isinstance(radius, (int, float)) else list(radius)
+        rotations = [rotations] * count if isinstance(rotations, (int, float)) else list(rotations)
+        colors = [colors] * count if Raster.is_color(colors) else list(colors)
+
+        # One value for each polygon
+        for name, values in (('radius', radii), ('rotations', rotations), ('colors', colors)):
+            if len(values) != count:
+                raise ValueError(f"Length of '{name}' ({len(values)}) doesn't match the centers ({count})")
+
+        # Headless: fill all polygons at once, then draw the outlines with the pen
+        if raster is not None:
+            polygons = [self.transform_points(template, _radius, rotation, x, y)
+                        for (x, y), _radius, rotation in zip(centers, radii, rotations)]
+            if fill:
+                fill_colors = [self.fill_attr['fillcolor'] if color is None else color for color in colors]
+                raster.fill_polygons(polygons, fill_colors)
+                if self.drawing is not None:
+                    for polygon, color in zip(polygons, fill_colors):
+                        self.drawing.add_polygon(polygon, color)
+            for polygon, color in zip(polygons, colors):
+                self.raster_shape(raster, [polygon + polygon[:1]], color=color)
+            return
+
+        start_x, start_y = self.pos()
+        for (x, y), _radius, rotation, color in zip(centers, radii, rotations, colors):
+            points = self.transform_points(template, _radius, rotation, x, y)
+            self.color(color) if color is not None else None  # 'color()' will change 'pencolor()' and 'fillcolor()'
+
+            # Draw the polygon
+            self.teleport(*points[0])
+            self.begin_fill() if fill else None
+            self.draw_path(points + points[:1])
+            self.end_fill() if fill else None
+
+        # Move the turtle back to the start position
+        self.teleport(start_x, start_y)
 
     # Draw an art with shapes
     # FEATURE
@@ -396,9 +1229,20 @@ class ModernArt(Turtle):
         :param space_size: Size of each space between dashes.
         """
 
-        for i in range(steps):
-            self.draw_space(space_size) if i != 0 else None  # Draw space at the first of each step, Except the first
-            self.draw_dash(dash_size)  # Draw dash
+        # Nothing to draw
+        if steps <= 0 or dash_size + space_size <= 0:
+            return
+
+        # The line: 'steps' dashes and a space between each two
+        length = steps * dash_size + (steps - 1) * space_size
+        x, y = self.pos()
+        heading = math.radians(self.heading())
+        end = (x + length * math.cos(heading), y + length * math.sin(heading))
+
+        # Draw dashes
+        self.pendown()
+        self.draw_path([(x, y), end], dashes=(dash_size, space_size), phase=0)
+        self.penup()
 
     # Random walk drawing
     def draw_random_walk(self, length, steps) -> None:
@@ -412,33 +1256,56 @@ class ModernArt(Turtle):
         :param steps: Number of steps to take.
         """
 
+        points = [self.pos()]
+        colors = []
         for _ in range(steps):
-            self.pencolor(*RGB())  # Random pencolor
+            colors.append(RGB().hex)  # Random pencolor
 
             # Calculate turn angle
             ang = random.choice([0, 90, 180, 270, 360])
             sig = random.choice([-1, +1])
 
-            # Set up  the angle and draw
-            self.setheading(ang * sig)  # you can use '.right()' or '.left()' functions too
-            self.forward(length)
+            # Walk in the direction of the angle
+            x, y = points[-1]
+            points.append((x + length * math.cos(math.radians(ang * sig)),
+                           y + length * math.sin(math.radians(ang * sig))))
+
+        # Draw the walk as one path, then turn once to the last direction
+        self.draw_path(points, colors)
+        self.setheading(ang * sig) if steps > 0 else None  # you can use '.right()' or '.left()' functions too
 
     # Draw circles with one share point
-    def draw_spiral_circles(self, radius, circles, random_color=False) -> None:
+    def draw_spiral_circles(self, radius, circles, random_color=False, fill=False, raster=None,
+                            rule='evenodd') -> None:
         """
         Draw circles with a shared center point.
+        - with 'fill', all circles are filled together as one self-intersecting shape
         # Feature: get angle for each step
 
         :param radius: Radius of each circle.
         :param circles: Number of circles to draw.
         :param random_color: Whether to use random colors for each circle.
+        :param fill: Fill the circles as one shape or not.
+        :param raster: Draw on a Raster® object (headless) instead of the screen.
+        :param rule: Fill rule on the Raster®, 'evenodd' or 'nonzero'.
         """
 
         ang = 360 // circles  # The angle of each turn
+
+        # Headless: fill all circles as one shape, then draw the outlines
+        if raster is not None:
+            paths = [self.circle_path(radius, heading=heading) for heading in range(0, 360, ang)]
+            self.raster_shape(raster, paths, fill, rule, stroke=False) if fill else None
+            for path in paths:
+                self.raster_shape(raster, [path], color=RGB().hex if random_color else None)
+            return
+
+        self.begin_fill() if fill else None
         for heading in range(0, 360, ang):
             self.random_turtle_color() if random_color else None  # Random color
             self.setheading(heading)  # Set angle
-            self.circle(radius)  # Draw
+            self.draw_arc(radius)  # Draw
+        self.end_fill() if fill else None
 
     # Draw donat with circles
     def draw_spiral_donat(self, radius, circles, random_color=False) -> None:
@@ -464,47 +1331,114 @@ class ModernArt(Turtle):
             self.pendown()
 
             # Draw
-            self.circle(radius)
+            self.draw_arc(radius)
             # self.circle((radius * (360 - heading) / 360) + (radius * 0.25))
 
             # Position "A" : The center
             self.penup()
             self.back(radius)
 
+    # Grid points generator
+    @staticmethod
+    def grid_chunks(x_start, x_stop, x_step, y_start, y_stop, y_step, jitter=0, chunk_size=4096):
+        """
+        Generate the points of a grid in chunks.
+        - points are made lazily, the whole grid is never stored in memory
+        - the grid is walked column by column, same as the nested 'range()' loops
+        - the points are 'start + i * step', so float starts and steps work without drifting
+        - 'jitter' moves each point randomly up to the given distance on each axis
+
+        :param x_start: Start of the x-axis.
+        :param x_stop: Stop of the x-axis (exclusive, same as 'range()').
+        :param x_step: Distance between the columns.
+        :param y_start: Start of the y-axis.
+        :param y_stop: Stop of the y-axis (exclusive, same as 'range()').
+        :param y_step: Distance between the rows.
+        :param jitter: Maximum random move of each point.
+        :param chunk_size: Maximum number of points in each chunk.
+        :return: Generator of lists containing (x, y) points.
+        """
+
+        # Check the steps
+        if not x_step or not y_step:
+            raise ValueError("Grid steps must not be zero")
+
+        # Number of the columns and rows, same as 'len(range())'
+        columns = max(0, math.ceil((x_stop - x_start) / x_step))
+        rows = max(0, math.ceil((y_stop - y_start) / y_step))
+
+        chunk = []
+        for i in range(columns):
+            x = x_start + i * x_step
+            for j in range(rows):
+                y = y_start + j * y_step
+                # Random move of the point
+                if jitter:
+                    chunk.append((x + ModernArt.random_direction() * jitter, y + ModernArt.random_direction() * jitter))
+                else:
+                    chunk.append((x, y))
+
+                # Yield a full chunk
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+
+        # The last chunk
+        if chunk:
+            yield chunk
+
     # Draw dot grid
-    def draw_grid_dot(self, width=None, height=None, dot_size=3, times=3) -> None:
+    def draw_grid_dot(self, width=None, height=None, dot_size=3, times=3, x_times=None, y_times=None,
+                      start_x=0, start_y=0, jitter=0, raster=None) -> None:
         """
         Draw a doted grid.
+        Powered by 'grid_chunks()'.
         # Feature: grid types -> ('Lines', 'Dots')
-        # Feature: get x-axis and y-axis times to divide
-        # Feature: get start coordinates
 
         :param width: Width of the grid.
         :param height: Height of the grid.
         :param dot_size: Size of the dot grid.
         :param times: Number of divisions in each direction.
+        :param x_times: Number of divisions on the x-axis (default is 'times').
+        :param y_times: Number of divisions on the y-axis (default is 'times').
+        :param start_x: x-coordinate of the grid center.
+        :param start_y: y-coordinate of the grid center.
+        :param jitter: Maximum random move of each dot.
+        :param raster: Draw on a Raster® object (headless) instead of the screen.
         """
 
         # Check width and height
         width = self.width if width is None else width
         height = self.height if height is None else height
 
+        # Check x-axis and y-axis times
+        x_times = times if x_times is None else x_times
+        y_times = times if y_times is None else y_times
+
         # Calculate the screen range
         _x = width // 2
         _y = height // 2
 
         # Calculate the steps
-        x_step = width // times
-        y_step = height // times
-
-        # Divide the screen to 'times'
-        for x in range(_x * -1, _x + dot_size, x_step):
-            for y in range(_y * -1, _y + dot_size, y_step):
+        x_step = width // x_times
+        y_step = height // y_times
+
+        # Divide the screen to 'x_times' and 'y_times'
+        chunks = self.grid_chunks(start_x - _x, start_x + _x + dot_size, x_step,
+                                  start_y - _y, start_y + _y + dot_size, y_step, jitter=jitter)
+        for chunk in chunks:
+            # Headless: draw the whole chunk at once
+            if raster is not None:
+                raster.draw_dots(chunk, dot_size, self.pen_attr['pencolor'])
+                self.drawing.add_dots(chunk, dot_size, self.pen_attr['pencolor']) if self.drawing is not None else None
+                continue
+
+            for x, y in chunk:
                 self.teleport(x, y)
                 self.dot(dot_size)
 
     # Draw bubbles all over the Screen
-    def draw_bubbles(self, bubbles, radius, random_color=False, fill=True) -> None:
+    def draw_bubbles(self, bubbles, radius, random_color=False, fill=True, raster=None) -> None:
         """
         Draw bubbles on screen in random order.
         # Feature : get range as radius to
@@ -514,37 +1448,60 @@ class ModernArt(Turtle):
         :param radius: Radius of each bubble.
         :param random_color: Whether to use random colors for each bubble.
         :param fill: Whether to fill the bubbles with color.
+        :param raster: Draw on a Raster® object (headless) instead of the screen, the outlines are drawn over all fills.
         """
 
         # Screen Width and Height
         size = (self.width // 2, self.height // 2)
 
+        # Headless: all bubbles at once
+        if raster is not None:
+            centers = [self.random_direction(*size) for _ in range(bubbles)]  # Random positions in screen
+            self.raster_circles(raster, centers, radius, fill, [RGB().hex for _ in centers] if random_color else None)
+            return
+
         for _ in range(bubbles):
             self.color(RGB().hex) if random_color else None  # 'color()' will change 'pencolor()' and 'fillcolor()'
             _x, _y = self.random_direction(*size)  # Random position in screen
             self.draw_circle(radius=radius, center_x=_x, center_y=_y, fill=fill, center_base=True)  # Draw
 
     # Draw the First ModernArt
-    def draw_dot_dots(self, step, radius, random_color=True) -> None:
+    def draw_dot_dots(self, step, radius, random_color=True, y_step=None, jitter=0, raster=None) -> None:
         """
         The VeryFirst ModernArt®: Dot Dots v1.
         Draw sorted circles on screen with random styles.
+        Powered by 'grid_chunks()'.
         # Feature: draw the art in the center of the screen
 
         :param step: Distance between each dot.
         :param radius: Radius of each dot.
         :param random_color: Whether to use random colors for each dot.
+        :param y_step: Distance between each dot on the y-axis (default is 'step').
+        :param jitter: Maximum random move of each dot.
+        :param raster: Draw on a Raster® object (headless) instead of the screen.
         """
 
+        # Check y-axis step
+        y_step = step if y_step is None else y_step
+
         # Calculate the screen range
         x_range = self.width // 2
         y_range = self.height // 2
 
-        for _x in range(step + x_range * -1, x_range, step):
-            for _y in range(step + y_range * -1, y_range, step):
-                _color = RGB().hex if random_color else self.fill_attr['fillcolor']
+        chunks = self.grid_chunks(step + x_range * -1, x_range, step,
+                                  y_step + y_range * -1, y_range, y_step, jitter=jitter)
+        for chunk in chunks:
+            _colors = [RGB().hex for _ in chunk] if random_color else self.fill_attr['fillcolor']
+
+            # Headless: draw the whole chunk at once
+            if raster is not None:
+                raster.draw_dots(chunk, radius, _colors)
+                self.drawing.add_dots(chunk, radius, _colors) if self.drawing is not None else None
+                continue
+
+            for i, (_x, _y) in enumerate(chunk):
                 self.teleport(_x, _y)
-                self.dot(radius, _color)
+                self.dot(radius, _colors[i] if random_color else _colors)
 
     # Modules info/help
     def info(self) -> None:
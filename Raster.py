@@ -0,0 +1,433 @@
+from RGB import RGB
+import functools
+import math
+
+
+class Raster:
+    """
+    The Raster® Module.
+    An off-screen (headless) drawing board for the ModernArt® module.
+    Draws into a plain RGB pixel buffer, no Tk window is required.
+    Uses the same coordinates as the turtle screen: (0, 0) is the center and 'y' goes up.
+
+    author: MKinG©™
+    """
+
+    # Maximum number of the cached circle masks, and the maximum radius of a cached mask (bounds the memory)
+    MASK_CACHE_SIZE = 4096
+    MASK_CACHE_RADIUS = 16
+
+    # Sub-pixel steps of the circle centers (the centers are snapped to 1 / SUBPIXELS px)
+    SUBPIXELS = 32
+
+    def __init__(self, width=1280, height=720, bgcolor=None):
+        """
+        Initialize the Raster® object.
+        - default background color is a random color generated by the RGB® color module
+        - default resolutions is 1280 × 720 : (16:9, HD 720p)
+
+        :param width: Width of the drawing board in px.
+        :param height: Height of the drawing board in px.
+        :param bgcolor: Background color (RGB® object, '#hex' or (0-1, 0-1, 0-1)).
+        """
+
+        # Width & Height of drawing board
+        self.width = width
+        self.height = height
+
+        # Attributes for raster object
+        self.attr = {
+            'bgcolor': RGB().hex if bgcolor is None else bgcolor,
+        }
+
+        # The pixels: 3 bytes (R, G, B) per pixel, row by row from the top-left corner
+        self.pixels = bytearray(self.to_bytes(self.attr['bgcolor']) * (width * height))
+
+    def __repr__(self):
+        """Representation of Raster® object."""
+        return f"Raster® Object ⧉ W:{self.width} × H:{self.height} | ID:{id(self)}"
+
+    @staticmethod
+    def to_bytes(color) -> bytes:
+        """
+        Convert a color to 3 bytes (R, G, B).
+        - accepts RGB® objects, hexadecimal strings ('#ffffff') and turtle style tuples (0-1, 0-1, 0-1)
+        - 'None' will be assigned a random color
+
+        :param color: The color to convert.
+        :return: Bytes of the color (0-255, 0-255, 0-255).
+        """
+
+        # Random color
+        if color is None:
+            return bytes(RGB().cir)
+        # RGB® object
+        if isinstance(color, RGB):
+            return bytes(color.cir)
+        # Hexadecimal: '#ffffff'
+        if isinstance(color, str):
+            return bytes.fromhex(color.lstrip('#'))
+        # Bytes: (0-255, 0-255, 0-255)
+        if isinstance(color, (bytes, bytearray)):
+            return bytes(color)
+        # Tuple: (0-1, 0-1, 0-1)
+        return bytes(RGB(*color).cir)
+
+    @staticmethod
+    def is_color(color) -> bool:
+        """
+        Check if the value is a single color (not a sequence of colors).
+
+        :param color: The value to check.
+        :return: True if the value is a single color.
+        """
+
+        if color is None or isinstance(color, (str, RGB, bytes, bytearray)):
+            return True
+        return len(color) == 3 and all(isinstance(c, (int, float)) for c in color)
+
+    def color_bytes(self, colors, count) -> list:
+        """
+        Convert color(s) to a list of bytes, one for each shape.
+        - a single color is shared by all shapes
+        - 'None' will be assigned a random color for each shape
+
+        :param colors: A single color or a sequence of colors.
+        :param count: Number of shapes.
+        :return: List of color bytes.
+        """
+
+        # One color for every shape
+        if colors is not None and self.is_color(colors):
+            return [self.to_bytes(colors)] * count
+        # Random color for every shape
+        if colors is None:
+            return [self.to_bytes(None) for _ in range(count)]
+
+        # Convert the colors (same colors are converted once)
+        cache = {}
+        result = []
+        for color in colors:
+            key = color if isinstance(color, (str, tuple)) else id(color)
+            if key not in cache:
+                cache[key] = self.to_bytes(color)
+            result.append(cache[key])
+        return result
+
+    def blend(self, index, color, alpha) -> None:
+        """
+        Blend a color over the pixel at the buffer index.
+        - 'alpha' is the coverage of the pixel (0 to 1)
+
+        :param index: Index of the pixel in the buffer (pixel number × 3).
+        :param color: Bytes of the color.
+        :param alpha: Coverage of the pixel.
+        """
+
+        pixels = self.pixels
+        for i in range(3):
+            old = pixels[index + i]
+            pixels[index + i] = int(old + (color[i] - old) * alpha + 0.5)
+
+    # Coverage mask of a circle
+    @staticmethod
+    def circle_mask(radius, fx, fy) -> tuple:
+        """
+        Get the anti-aliased coverage of a circle, row by row.
+        - the offsets are relative to the pixel of the center
+
+        :param radius: Radius of the circle.
+        :param fx: Sub-pixel x-coordinate of the center (0 to 1).
+        :param fy: Sub-pixel y-coordinate of the center (0 to 1, pixel space).
+        :return: Tuple of rows: (row offset, first full column, last full column, ((column offset, alpha), ...)).
+        """
+
+        outer = radius + 0.5
+        outer_sq = outer * outer
+        inner = radius - 0.5
+        inner_sq = inner * inner if inner > 0 else -1.0
+        reach = math.ceil(outer) + 1
+        rows = []
+
+        for row in range(-reach, reach + 1):
+            dy = row + 0.5 - fy
+            dy_sq = dy * dy
+            if dy_sq >= outer_sq:
+                continue
+
+            # The inside span: distance to center <= radius - 0.5
+            if inner_sq > dy_sq:
+                half = math.sqrt(inner_sq - dy_sq)
+                first, last = math.ceil(fx - half - 0.5), math.floor(fx + half - 0.5)
+            else:
+                first, last = 1, 0  # Empty span
+
+            # The edges: left and right of the inside span
+            half = math.sqrt(outer_sq - dy_sq)
+            left, right = math.floor(fx - half - 0.5), math.floor(fx + half - 0.5) + 1
+            edges = []
+            for col in (*range(left, min(first, right + 1)), *range(max(last + 1, left), right + 1)):
+                dx = col + 0.5 - fx
+                alpha = outer - math.sqrt(dx * dx + dy_sq)
+                edges.append((col, min(alpha, 1))) if alpha > 0 else None
+            rows.append((row, first, last, tuple(edges)))
+
+        return tuple(rows)
+
+    # Cached coverage masks of the small circles
+    @staticmethod
+    @functools.lru_cache(maxsize=MASK_CACHE_SIZE)
+    def cached_circle_mask(radius, fx, fy) -> tuple:
+        """
+        Get the coverage of a circle like 'circle_mask()', cached.
+        - cached by the radius and the sub-pixel position of the center, the recently used masks are kept (LRU)
+        - the sub-pixel position is snapped to 'SUBPIXELS' steps in 'draw_circles()', so the masks are shared
+        - only the radii up to 'MASK_CACHE_RADIUS' are cached, a mask takes O(radius) memory
+
+        :param radius: Radius of the circle.
+        :param fx: Sub-pixel x-coordinate of the center (0 to 1).
+        :param fy: Sub-pixel y-coordinate of the center (0 to 1, pixel space).
+        :return: Tuple of rows, same as 'circle_mask()'.
+        """
+
+        return Raster.circle_mask(radius, fx, fy)
+
+    # Draw many circles at once
+    def draw_circles(self, centers, radii, colors=None) -> None:
+        """
+        Draw filled circles with anti-aliased edges.
+        Powered by 'cached_circle_mask()', small circles with the same radius and sub-pixel position share one mask.
+        - the centers are snapped to 1 / SUBPIXELS px
+        - circles are drawn in the given order, the later ones are drawn over the earlier ones
+        - the inside of each row is filled at once, only the edge pixels are blended one by one
+
+        :param centers: Sequence of (x, y) centers.
+        :param radii: Radius of all circles, or a sequence of radii (one per circle).
+        :param colors: A single color or a sequence of colors (one per circle), random if None.
+        """
+
+        # Materials
+        centers = list(centers)
+        radii = [radii] * len(centers) if isinstance(radii, (int, float)) else list(radii)
+        colors = self.color_bytes(colors, len(centers))
+        pixels = self.pixels
+        width = self.width
+        height = self.height
+        half_w = width / 2
+        half_h = height / 2
+        subpixels = self.SUBPIXELS
+
+        for (x, y), radius, color in zip(centers, radii, colors):
+            # Center of the circle in sub-pixels: the pixel and the sub-pixel position
+            cx = round((x + half_w) * subpixels)
+            cy = round((half_h - y) * subpixels)
+            ix, fx = divmod(cx, subpixels)
+            iy, fy = divmod(cy, subpixels)
+            red, green, blue = color
+
+            # Large masks are built for each circle (they would fill the cache)
+            mask = self.cached_circle_mask if radius <= self.MASK_CACHE_RADIUS else self.circle_mask
+            for row, first, last, edges in mask(radius, fx / subpixels, fy / subpixels):
+                row += iy
+                if not 0 <= row < height:
+                    continue
+                base = row * width + ix
+
+                # The inside: one slice assignment per row (clipped to the board)
+                first = max(first, -ix)
+                last = min(last, width - 1 - ix)
+                if first <= last:
+                    pixels[(base + first) * 3:(base + last + 1) * 3] = color * (last - first + 1)
+
+                # The edges
+                for col, alpha in edges:
+                    if 0 <= ix + col < width:
+                        index = (base + col) * 3
+                        old = pixels[index]
+                        pixels[index] = int(old + (red - old) * alpha + 0.5)
+                        old = pixels[index + 1]
+                        pixels[index + 1] = int(old + (green - old) * alpha + 0.5)
+                        old = pixels[index + 2]
+                        pixels[index + 2] = int(old + (blue - old) * alpha + 0.5)
+
+    # Draw many dots at once
+    def draw_dots(self, points, size, colors=None) -> None:
+        """
+        Draw dots like the turtle 'dot()' function, in bulk.
+        - 'size' is the diameter of the dot, same as 'dot()'
+
+        :param points: Sequence of (x, y) points.
+        :param size: Diameter of all dots, or a sequence of diameters.
+        :param colors: A single color or a sequence of colors (one per dot), random if None.
+        """
+
+        radii = size / 2 if isinstance(size, (int, float)) else [s / 2 for s in size]
+        self.draw_circles(points, radii, colors)
+
+    # Fill a shape made of closed paths
+    def fill_paths(self, paths, color=None, rule='evenodd') -> None:
+        """
+        Fill a shape made of one or more closed paths with a scanline (active-edge table).
+        - each path is closed automatically, paths may cross themselves and each other
+        - 'evenodd': a point is inside if a ray from it crosses the paths an odd number of times
+        - 'nonzero': a point is inside if the paths wind around it (same as most vector tools)
+        - a pixel is filled if its center is inside the shape
+        # Feature: anti-aliased edges
+
+        :param paths: Sequence of paths, each one a sequence of (x, y) points.
+        :param color: Color of the fill, random if None.
+        :param rule: Fill rule, 'evenodd' or 'nonzero'.
+        """
+
+        if rule not in ('evenodd', 'nonzero'):
+            raise ValueError(f"Invalid fill rule: {rule}")
+
+        # Materials
+        color = self.to_bytes(color)
+        pixels = self.pixels
+        width = self.width
+        height = self.height
+        half_w = width / 2
+        half_h = height / 2
+
+        # Edge table: the edges are listed by their first row
+        table = {}
+        for path in paths:
+            points = [(x + half_w, half_h - y) for x, y in path]
+            for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+                # Horizontal edges never cross a row center
+                if y0 == y1:
+                    continue
+                direction = 1 if y1 > y0 else -1
+                if y0 > y1:
+                    x0, y0, x1, y1 = x1, y1, x0, y0
+
+                # Rows with the center inside [y0, y1)
+                first = max(0, math.ceil(y0 - 0.5))
+                last = min(height - 1, math.ceil(y1 - 0.5) - 1)
+                if first > last:
+                    continue
+                slope = (x1 - x0) / (y1 - y0)
+                x = x0 + (first + 0.5 - y0) * slope
+                table.setdefault(first, []).append([x, slope, last, direction])
+
+        # Nothing to fill
+        if not table:
+            return
+        bottom = max(edge[2] for edges in table.values() for edge in edges)
+
+        # Active edges
+        active = []
+        for row in range(min(table), bottom + 1):
+            # Add the new edges and remove the finished ones
+            active = [edge for edge in active if edge[2] >= row] + table.get(row, [])
+            if not active:
+                continue
+            active.sort()
+            base = row * width
+
+            # Spans: from the entering edge to the leaving edge
+            winding = 0
+            enter = 0
+            for edge in active:
+                inside = winding % 2 if rule == 'evenodd' else winding
+                winding += 1 if rule == 'evenodd' else edge[3]
+                now = winding % 2 if rule == 'evenodd' else winding
+                if not inside and now:
+                    enter = edge[0]
+                elif inside and not now:
+                    start = max(0, math.ceil(enter - 0.5))
+                    end = min(width, math.ceil(edge[0] - 0.5))
+                    if start < end:
+                        pixels[(base + start) * 3:(base + end) * 3] = color * (end - start)
+
+            # Move the edges to the next row
+            for edge in active:
+                edge[0] += edge[1]
+
+    # Fill a polygon
+    def fill_polygon(self, points, color=None, rule='evenodd') -> None:
+        """
+        Fill a closed path (polygon).
+        Powered by 'fill_paths()'.
+
+        :param points: Sequence of (x, y) points of the path.
+        :param color: Color of the fill, random if None.
+        :param rule: Fill rule, 'evenodd' or 'nonzero'.
+        """
+
+        self.fill_paths([points], color, rule)
+
+    # Fill many polygons at once
+    def fill_polygons(self, polygons, colors=None, rule='evenodd') -> None:
+        """
+        Fill many polygons, the later ones are drawn over the earlier ones.
+        Powered by 'fill_paths()'.
+
+        :param polygons: Sequence of polygons, each one a sequence of (x, y) points.
+        :param colors: A single color or a sequence of colors (one per polygon), random if None.
+        :param rule: Fill rule, 'evenodd' or 'nonzero'.
+        """
+
+        polygons = list(polygons)
+        for points, color in zip(polygons, self.color_bytes(colors, len(polygons))):
+            self.fill_paths([points], color, rule)
+
+    # Draw a line path
+    def draw_path(self, points, size=1, color=None) -> None:
+        """
+        Draw a path of lines with round corners, like the turtle pen.
+        Powered by 'fill_paths()' and 'draw_circles()'.
+
+        :param points: Sequence of (x, y) points of the path.
+        :param size: Size of the pen.
+        :param color: Color of the pen, random if None.
+        """
+
+        color = self.to_bytes(color)
+        points = [tuple(point) for point in points]
+        half = size / 2
+
+        # The lines: one rectangle for each line, filled together
+        lines = []
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            length = math.hypot(x1 - x0, y1 - y0)
+            if length == 0:
+                continue
+            nx = (y0 - y1) / length * half
+            ny = (x1 - x0) / length * half
+            lines.append([(x0 + nx, y0 + ny), (x1 + nx, y1 + ny), (x1 - nx, y1 - ny), (x0 - nx, y0 - ny)])
+        self.fill_paths(lines, color, 'nonzero')
+
+        # The round corners
+        self.draw_circles(points, half, color)
+
+    def pixel(self, x, y) -> tuple:
+        """
+        Get the color of the pixel at the position.
+
+        :param x: x-coordinate (turtle screen).
+        :param y: y-coordinate (turtle screen).
+        :return: Tuple containing (R, G, B) color values in the range of 0 to 255.
+        """
+
+        col = math.floor(x + self.width / 2)
+        row = math.floor(self.height / 2 - y)
+        if not (0 <= col < self.width and 0 <= row < self.height):
+            raise IndexError(f"Pixel out of the drawing board: ({x}, {y})")
+        index = (row * self.width + col) * 3
+        return tuple(self.pixels[index:index + 3])
+
+    def save(self, path) -> str:
+        """
+        Save the drawing board as a binary PPM (P6) image.
+        # Feature: save as PNG
+
+        :param path: Path of the output file.
+        :return: The path of the output file.
+        """
+
+        with open(path, 'wb') as file:
+            file.write(f"P6 {self.width} {self.height} 255\n".encode())
+            file.write(self.pixels)
+        return path
@@ -0,0 +1,343 @@
+from ModernArt import ModernArt
+from CustomScreen import CustomScreen
+from Raster import Raster
+import multiprocessing
+import socketserver
+import threading
+import itertools
+import tkinter
+import socket
+import inspect
+import queue
+import json
+import os
+
+
+class RenderDaemon:
+    """
+    The RenderDaemon® Module.
+    A local render service for the ModernArt® module over a Unix domain socket.
+    Keeps a pool of warm workers, each one with a ready (headless) ModernArt® object.
+
+    Protocol: one JSON request per line, one JSON response per line.
+    - request: {"method": "draw_bubbles", "params": {"bubbles": 10, "radius": 20}, "output": "/tmp/art.eps", "priority": 0}
+    - response: {"ok": true, "output": "/tmp/art.eps"} or {"ok": false, "error": "..."}
+    - lower 'priority' runs first, same priorities run in order
+    - '.ppm' outputs are drawn on a Raster® without Tk (method needs a 'raster' parameter)
+    - other outputs are drawn on a CustomScreen® and saved as PostScript (Tk is required)
+
+    author: MKinG©™
+    """
+
+    # Only these methods can be requested
+    METHOD_PREFIXES = ('draw_', 'stamp_')
+
+    # Start method of the workers: they are started from the dispatcher threads, 'fork()' is not safe there
+    START_METHOD = 'forkserver'
+
+    def __init__(self, socket_path, workers=2, width=1280, height=720, timeout=60):
+        """
+        Initialize the RenderDaemon® object.
+
+        :param socket_path: Path of the Unix domain socket.
+        :param workers: Number of the worker processes.
+        :param width: Width of drawing board in px.
+        :param height: Height of drawing board in px.
+        :param timeout: Maximum seconds for a worker to start or to render a job.
+        """
+
+        self.socket_path = socket_path
+        self.width = width
+        self.height = height
+        self.timeout = timeout
+
+        # Jobs: (priority, number, job, reply)
+        self.jobs = queue.PriorityQueue()
+        self.counter = itertools.count()
+
+        # Workers and the socket server
+        self.context = multiprocessing.get_context(self.START_METHOD)
+        self.workers = workers
+        self.processes = []
+        self.server = None
+
+    def __repr__(self):
+        """Representation of RenderDaemon® object."""
+        return f"RenderDaemon® Object ⧉ {self.socket_path} × {self.workers} | ID:{id(self)}"
+
+    @staticmethod
+    def build_art(width, height) -> ModernArt:
+        """
+        Build a ModernArt® object with a screen for the PostScript jobs.
+        - the screen won't animate, the drawings are updated once for each job
+        - the screen is cleared first: the turtles and drawings of the last job are removed
+
+        :param width: Width of drawing board in px.
+        :param height: Height of drawing board in px.
+        :return: The ModernArt® object.
+        """
+
+        screen = CustomScreen(width, height)
+        screen.screen.clear()
+        screen.screen_setup()
+        screen.screen.tracer(0)
+        art = ModernArt(width, height)
+        art.setup_wizard()
+        return art
+
+    @staticmethod
+    def render(art, job) -> str:
+        """
+        Render a job with a warm ModernArt® object.
+        - headless objects draw on a Raster®, the others on the screen
+        - screen objects must be clean, a new one from 'build_art()' for each job
+
+        :param art: The ModernArt® object.
+        :param job: The job: {'method', 'params', 'output'}.
+        :return: The path of the output file.
+        """
+
+        method = job['method']
+        params = dict(job.get('params') or {})
+        output = job['output']
+
+        # Check the method
+        if not method.startswith(RenderDaemon.METHOD_PREFIXES) or not hasattr(art, method):
+            raise ValueError(f"Unknown method: {method}")
+        draw = getattr(art, method)
+
+        # Headless: draw on a Raster®
+        if art.headless:
+            if 'raster' not in inspect.signature(draw).parameters:
+                raise ValueError(f"Method can't draw on a Raster®: {method}")
+            art.reset()
+            raster = Raster(art.width, art.height)
+            draw(**params, raster=raster)
+            return raster.save(output)
+
+        # Screen: save the canvas as PostScript
+        draw(**params)
+        art.getscreen().update()
+        art.getscreen().getcanvas().postscript(file=output)
+        return output
+
+    @classmethod
+    def work(cls, connection, width, height) -> None:
+        """
+        The loop of a worker process.
+        - the headless ModernArt® object (for '.ppm' outputs) is built once at the start
+        - the screen (Tk) is built at the start too if there's a display, else for the first PostScript job
+        - each PostScript job gets a clean screen, the next one is built after the reply
+
+        :param connection: The worker side of the pipe.
+        :param width: Width of drawing board in px.
+        :param height: Height of drawing board in px.
+        """
+
+        def warm_screen():
+            """Build a clean screen, or None if there's no display (the job will build it and fail)."""
+            try:
+                return cls.build_art(width, height)
+            except tkinter.TclError:
+                return None
+
+        headless = ModernArt(width, height, headless=True)
+        screen = warm_screen()
+        display = screen is not None
+        connection.send('ready')
+
+        # The attributes are synced with the changes of each job, restore them before the next one
+        defaults = (dict(headless.turtle_attr), dict(headless.pen_attr), dict(headless.fill_attr))
+
+        while (job := connection.recv()) is not None:
+            try:
+                # Choose the ModernArt® object: the headless one, or a clean screen (used once)
+                if job['output'].endswith('.ppm'):
+                    art = headless
+                    art.turtle_attr, art.pen_attr, art.fill_attr = (dict(attributes) for attributes in defaults)
+                else:
+                    art = cls.build_art(width, height) if screen is None else screen
+                    screen = None
+
+                connection.send({'ok': True, 'output': cls.render(art, job)})
+            except Exception as error:
+                connection.send({'ok': False, 'error': f"{type(error).__name__}: {error}"})
+
+            # Clean the used screen for the next job
+            screen = warm_screen() if display and screen is None else screen
+
+    def spawn(self):
+        """
+        Start a worker process and wait until it's warm.
+
+        :return: Tuple of (process, connection), or None if the worker couldn't start.
+        """
+
+        connection, worker_connection = self.context.Pipe()
+        process = self.context.Process(target=self.work, args=(worker_connection, self.width, self.height),
+                                          daemon=True)
+        process.start()
+        self.processes.append(process)
+
+        # Wait for 'ready'
+        try:
+            if connection.poll(self.timeout) and connection.recv() == 'ready':
+                return process, connection
+        except (EOFError, OSError):
+            pass
+
+        self.retire(process)
+        return None
+
+    def retire(self, process) -> None:
+        """
+        Stop a worker process and forget it.
+
+        :param process: The worker process.
+        """
+
+        process.terminate() if process.is_alive() else None
+        process.join()
+        self.processes.remove(process)
+
+    def dispatch(self) -> None:
+        """
+        The loop of a dispatcher thread: send the jobs to one worker, in priority order.
+        - a crashed or stuck worker is replaced with a new one
+        - if no worker can start, the jobs fail instead of waiting
+        """
+
+        worker = self.spawn()
+
+        while (item := self.jobs.get())[2] is not None:
+            _, _, job, reply = item
+
+            # Try again to start a worker
+            worker = self.spawn() if worker is None else worker
+            if worker is None:
+                reply({'ok': False, 'error': "Worker failed to start"})
+                continue
+
+            process, connection = worker
+            try:
+                connection.send(job)
+                if not connection.poll(self.timeout):
+                    raise TimeoutError
+                reply(connection.recv())
+            except TimeoutError:
+                reply({'ok': False, 'error': f"Job timed out after {self.timeout} seconds"})
+                self.retire(process)
+                worker = self.spawn()
+            except (EOFError, OSError):
+                reply({'ok': False, 'error': "Worker crashed"})
+                self.retire(process)
+                worker = self.spawn()
+
+        # Stop the worker
+        if worker is not None:
+            process, connection = worker
+            connection.send(None)
+            process.join()
+            self.processes.remove(process)
+
+    def submit(self, job) -> dict:
+        """
+        Queue a job and wait for the result.
+
+        :param job: The job: {'method', 'params', 'output', 'priority'}.
+        :return: The result: {'ok', 'output'} or {'ok', 'error'}.
+        """
+
+        # Check the request
+        if not isinstance(job, dict):
+            raise TypeError("The request must be a JSON object")
+        priority = float(job.get('priority', 0))
+
+        done = threading.Event()
+        result = {}
+
+        def reply(value):
+            result.update(value)
+            done.set()
+
+        self.jobs.put((priority, next(self.counter), job, reply))
+        done.wait()
+        return result
+
+    def serve_forever(self) -> None:
+        """
+        Start the workers and serve the requests on the socket until 'shutdown()'.
+        """
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            """Read JSON requests line by line and write the results."""
+
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        result = daemon.submit(json.loads(line))
+                    except (ValueError, KeyError, TypeError) as error:
+                        result = {'ok': False, 'error': f"Bad request: {error}"}
+                    self.wfile.write(json.dumps(result).encode() + b'\n')
+
+        # Start the dispatchers (each one with a warm worker)
+        for _ in range(self.workers):
+            threading.Thread(target=self.dispatch, daemon=True).start()
+
+        # Serve on the socket
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self.server.daemon_threads = True
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            os.remove(self.socket_path)
+
+    def shutdown(self) -> None:
+        """
+        Stop serving and stop the workers after the queued jobs.
+        - call it from another thread than 'serve_forever()'
+        """
+
+        # Stop signals run after all the queued jobs
+        for _ in range(self.workers):
+            self.jobs.put((float('inf'), next(self.counter), None, None))
+        self.server.shutdown() if self.server is not None else None
+
+    @staticmethod
+    def request(socket_path, method, params=None, output='art.eps', priority=0) -> dict:
+        """
+        Send a job to a running RenderDaemon® and wait for the result.
+
+        :param socket_path: Path of the Unix domain socket.
+        :param method: Name of the ModernArt® method, like: 'draw_bubbles'.
+        :param params: Parameters of the method as a dict.
+        :param output: Path of the output file ('.ppm' for Raster®, else PostScript).
+        :param priority: Priority of the job, lower runs first.
+        :return: The result: {'ok', 'output'} or {'ok', 'error'}.
+        """
+
+        job = {'method': method, 'params': params or {}, 'output': os.path.abspath(output), 'priority': priority}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(job).encode() + b'\n')
+            return json.loads(client.makefile('rb').readline())
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="RenderDaemon®: render ModernArt® over a Unix domain socket.")
+    parser.add_argument('socket_path', help="Path of the Unix domain socket.")
+    parser.add_argument('--workers', type=int, default=2, help="Number of the worker processes.")
+    parser.add_argument('--width', type=int, default=1280, help="Width of drawing board in px.")
+    parser.add_argument('--height', type=int, default=720, help="Height of drawing board in px.")
+    parser.add_argument('--timeout', type=float, default=60, help="Maximum seconds for a job.")
+    arguments = parser.parse_args()
+
+    RenderDaemon(arguments.socket_path, arguments.workers, arguments.width, arguments.height,
+                 arguments.timeout).serve_forever()
@@ -0,0 +1,40 @@
+import unittest
+
+from ModernArt import ModernArt
+
+
+class DashSegmentsTest(unittest.TestCase):
+    """The dashes of 'ModernArt.dash_segments()' along an L-shaped path of length 8."""
+
+    PATH = [(0, 0), (4, 0), (4, 4)]
+
+    def test_gap_across_corner(self):
+        self.assertEqual(ModernArt.dash_segments(self.PATH, (3, 2)),
+                         [(0, [(0, 0), (3, 0)]), (1, [(4, 1), (4, 4)])])
+
+    def test_dash_through_corner(self):
+        self.assertEqual(ModernArt.dash_segments(self.PATH, (6, 1)),
+                         [(0, [(0, 0), (4, 0), (4, 2)]), (1, [(4, 3), (4, 4)])])
+
+    def test_phase(self):
+        expected = [(0, [(0, 0), (2, 0)]), (1, [(4, 0), (4, 3)])]
+        self.assertEqual(ModernArt.dash_segments(self.PATH, (3, 2), 1), expected)
+        self.assertEqual(ModernArt.dash_segments(self.PATH, (3, 2), 1 + 5), expected)
+        self.assertEqual(ModernArt.dash_segments(self.PATH, (3, 2), 1 - 5), expected)
+
+    def test_phase_in_gap(self):
+        self.assertEqual(ModernArt.dash_segments(self.PATH, (3, 2), 3),
+                         [(0, [(2, 0), (4, 0), (4, 1)]), (1, [(4, 3), (4, 4)])])
+
+    def test_odd_pattern(self):
+        self.assertEqual(ModernArt.dash_segments([(0, 0), (10, 0)], (2,)),
+                         [(0, [(0, 0), (2, 0)]), (0, [(4, 0), (6, 0)]), (0, [(8, 0), (10, 0)])])
+
+    def test_invalid_pattern(self):
+        for dashes in ((0, 0), (3, -1), ()):
+            with self.assertRaises(ValueError):
+                ModernArt.dash_segments(self.PATH, dashes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from Drawing import Drawing
+
+
+class DrawingTest(unittest.TestCase):
+    """Save and load the Drawing® binary file."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'art.mart')
+
+        self.drawing = Drawing(64, 48, '#102030')
+        self.drawing.add_circle(0, 0, 10, '#ff0000')
+        self.drawing.add_dot(5, 5, 6, '#00ff00')
+        self.drawing.add_path([(-20, -10), (0, 15), (20, -10)], 3, '#0000ff')
+        self.drawing.add_polygon([(-10, -10), (10, -10), (0, 10)], '#ffff00', 'nonzero')
+        self.drawing.save(self.path)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def check_same(self, loaded):
+        """Check the columns and the replay of a loaded drawing."""
+        self.assertEqual((loaded.width, loaded.height, bytes(loaded.bgcolor)), (64, 48, bytes.fromhex('102030')))
+        self.assertEqual(len(loaded), len(self.drawing))
+        for index in range(len(self.drawing)):
+            self.assertEqual(loaded.points(index), self.drawing.points(index))
+        for name in ('sizes', 'offsets', 'coords', 'ops', 'colors'):
+            self.assertEqual(list(getattr(loaded, name)), list(getattr(self.drawing, name)))
+        self.assertEqual(loaded.replay().pixels, self.drawing.replay().pixels)
+
+    def test_round_trip_mapped(self):
+        with Drawing.load(self.path) as loaded:
+            self.assertIsNotNone(loaded.buffer)
+            self.check_same(loaded)
+            with self.assertRaises(TypeError):
+                loaded.add_dot(0, 0, 1)
+        self.assertIsNone(loaded.buffer)
+        self.assertEqual(len(loaded), 0)
+
+    def test_round_trip_unmapped(self):
+        loaded = Drawing.load(self.path, mapped=False)
+        self.assertIsNone(loaded.buffer)
+        self.check_same(loaded)
+        loaded.add_dot(1, 1, 2, '#ffffff')
+        self.assertEqual(len(loaded), len(self.drawing) + 1)
+
+    def test_truncated_file(self):
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        for size in (len(data) - 1, Drawing.HEADER.size, 10):
+            with open(self.path, 'wb') as file:
+                file.write(data[:size])
+            for mapped in (True, False):
+                with self.assertRaises(ValueError):
+                    Drawing.load(self.path, mapped)
+
+    def test_not_a_drawing(self):
+        with open(self.path, 'r+b') as file:
+            file.write(b'NOPE')
+        with self.assertRaises(ValueError):
+            Drawing.load(self.path)
+
+    def test_empty_points(self):
+        with self.assertRaises(ValueError):
+            self.drawing.add_path([])
+
+    def test_lines_join_into_paths(self):
+        drawing = Drawing()
+        drawing.add_line((0, 0), (1, 1), 2, '#ffffff')
+        drawing.add_line((1, 1), (2, 0), 2, '#ffffff')
+        drawing.add_line((2, 0), (3, 0), 3, '#ffffff')  # Another pensize
+        drawing.add_line((5, 5), (6, 6), 3, '#ffffff')  # Not connected
+        self.assertEqual(len(drawing), 3)
+        self.assertEqual(drawing.points(0), [(0, 0), (1, 1), (2, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import math
+import unittest
+
+from Raster import Raster
+
+
+class RasterTest(unittest.TestCase):
+    """Fill rules, circles and pixels of the Raster® module."""
+
+    # A pentagram: the center is inside twice (winding number 2)
+    STAR = [(80 * math.cos(math.radians(90 + 144 * k)), 80 * math.sin(math.radians(90 + 144 * k))) for k in range(5)]
+
+    def fill_star(self, rule):
+        raster = Raster(200, 200, '#000000')
+        raster.fill_paths([self.STAR], '#ffffff', rule)
+        return raster
+
+    def test_pentagram_evenodd(self):
+        raster = self.fill_star('evenodd')
+        self.assertEqual(raster.pixel(0, 0), (0, 0, 0))
+        self.assertEqual(raster.pixel(0, 60), (255, 255, 255))
+
+    def test_pentagram_nonzero(self):
+        raster = self.fill_star('nonzero')
+        self.assertEqual(raster.pixel(0, 0), (255, 255, 255))
+        self.assertEqual(raster.pixel(0, 60), (255, 255, 255))
+
+    def test_unknown_rule(self):
+        with self.assertRaises(ValueError):
+            self.fill_star('winding')
+
+    def test_circle_area(self):
+        raster = Raster(300, 300, '#000000')
+        raster.draw_circles([(0, 0)], 100, '#ffffff')
+        self.assertAlmostEqual(sum(raster.pixels[0::3]) / 255, math.pi * 100 ** 2, delta=20)
+
+    def test_pixel_out_of_board(self):
+        raster = Raster(10, 10, '#000000')
+        self.assertEqual(raster.pixel(-5, 5), (0, 0, 0))
+        for x, y in ((5, 0), (0, 5.1), (-5.1, 0), (0, -5)):
+            with self.assertRaises(IndexError):
+                raster.pixel(x, y)
+
+
+if __name__ == '__main__':
+    unittest.main()